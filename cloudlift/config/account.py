@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 from boto3 import client
 
 
+@lru_cache(maxsize=None)
 def get_account_id(sts_client=None):
     sts_client = sts_client or client('sts')
     return sts_client.get_caller_identity().get('Account')
@@ -10,7 +10,7 @@ def highlight_production():
 
 def highlight_user_account_details():
     username, account = get_user_id()
-    print('''\033[93m 
+    print(f'''\033[93m 
 ******* Using Aws account {account} and Username {username} *******\033[0m
-'''.format(**locals()))
+''')
     
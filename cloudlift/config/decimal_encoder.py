@@ -24,3 +24,21 @@ class DecimalEncoder(json.JSONEncoder):
             else:
                 return int(o)
         return super(DecimalEncoder, self).default(o)
+
+
+def replace_decimals(obj):
+    '''
+        Recursively replace decimals in DynamoDB items with float or int
+        so the result can be serialised without DecimalEncoder
+    '''
+
+    if isinstance(obj, dict):
+        return {k: replace_decimals(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [replace_decimals(v) for v in obj]
+    if isinstance(obj, decimal.Decimal):
+        if abs(obj) % 1 > 0:
+            return float(obj)
+        else:
+            return int(obj)
+    return obj
@@ -6,6 +6,7 @@ from boto3.session import Session
 from cloudlift.exceptions import UnrecoverableException
 
 from cloudlift.config import get_account_id
+from cloudlift.config.region import get_client_for
 from cloudlift.config.logging import log_bold, log_err
 
 
@@ -27,6 +28,8 @@ def do_mfa_login(mfa_code=None, region='ap-south-1'):
         os.environ['AWS_SECRET_ACCESS_KEY'] = credentials['SecretAccessKey']
         os.environ['AWS_SESSION_TOKEN'] = credentials['SessionToken']
         os.environ['AWS_DEFAULT_REGION'] = region
+        # Clients created before login still hold the old credentials
+        get_client_for.cache_clear()
         return session_params
     except botocore.exceptions.ClientError as client_error:
         raise UnrecoverableException(str(client_error))
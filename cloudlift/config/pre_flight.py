@@ -14,7 +14,7 @@ def check_sns_topic_exists(topic_name, environment):
     except ClientError as e:
         if e.response['Error']['Code'] == 'NotFound':
             raise UnrecoverableException(
-                "Unable to find SNS topic {topic_name} in {environment} environment".format(**locals()))
+                f"Unable to find SNS topic {topic_name} in {environment} environment")
         else:
             raise UnrecoverableException(e.response['Error']['Message'])
         
@@ -26,7 +26,7 @@ def check_stack_exists(name, environment, cmd):
         cloudformation_client.describe_stacks(StackName=stack_name)
         if cmd == 'create':
             raise UnrecoverableException(
-                "CloudFormation stack {name} in {environment} environment already exists.".format(**locals()))
+                f"CloudFormation stack {name} in {environment} environment already exists.")
         elif cmd == 'update':
             return True
     except ClientError as e:
@@ -34,7 +34,7 @@ def check_stack_exists(name, environment, cmd):
             return True
         elif e.response['Error']['Code'] == 'ValidationError' and cmd == 'update':
             raise UnrecoverableException(
-                "CloudFormation stack {name} in {environment} environment does not exist.".format(**locals()))
+                f"CloudFormation stack {name} in {environment} environment does not exist.")
         else:
             raise UnrecoverableException(e.response['Error']['Message'])
 
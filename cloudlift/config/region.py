@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import boto3
 from botocore.exceptions import ClientError
 from cloudlift.exceptions import UnrecoverableException
@@ -14,6 +16,13 @@ def get_region_for_environment(environment):
         return aws_session.region_name
 
 
+def get_partition_for_environment(environment):
+    return boto3.session.Session().get_partition_for_region(
+        get_region_for_environment(environment)
+    )
+
+
+@lru_cache(maxsize=None)
 def get_client_for(resource, environment):
     try:
         return boto3.session.Session(
@@ -59,7 +68,7 @@ def get_notifications_arn_for_environment(environment):
             environment
         ).get_config()[environment]['environment']["notifications_arn"]
     except KeyError:
-        raise UnrecoverableException("Unable to find notifications arn for {environment}".format(**locals()))
+        raise UnrecoverableException(f"Unable to find notifications arn for {environment}")
 
 
 def get_ssl_certification_for_environment(environment):
@@ -68,4 +77,4 @@ def get_ssl_certification_for_environment(environment):
             environment
         ).get_config()[environment]['environment']["ssl_certificate_arn"]
     except KeyError:
-        raise UnrecoverableException("Unable to find ssl certificate for {environment}".format(**locals()))
+        raise UnrecoverableException(f"Unable to find ssl certificate for {environment}")
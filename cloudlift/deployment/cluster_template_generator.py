@@ -2,7 +2,6 @@ import json
 import re
 import textwrap
 
-from cfn_flip import to_yaml
 from stringcase import camelcase, pascalcase
 from troposphere import (Base64, FindInMap, Output, Parameter, Ref, Sub,
                          cloudformation, Export, GetAtt, Tags)
@@ -26,7 +25,7 @@ from troposphere.servicediscovery import PrivateDnsNamespace
 from troposphere.elasticloadbalancingv2 import LoadBalancer as ALBLoadBalancer
 from troposphere.elasticloadbalancingv2 import Listener as ALBListener, Action, Certificate, RedirectConfig, FixedResponseConfig
 
-from cloudlift.config import DecimalEncoder
+from cloudlift.config import replace_decimals
 from cloudlift.config import get_client_for, get_region_for_environment
 from cloudlift.deployment.template_generator import TemplateGenerator
 from cloudlift.version import VERSION
@@ -43,7 +42,7 @@ class ClusterTemplateGenerator(TemplateGenerator):
 
     def __init__(self, environment, environment_configuration, desired_instances=None):
         super(ClusterTemplateGenerator, self).__init__(environment)
-        self.configuration = environment_configuration
+        self.configuration = replace_decimals(environment_configuration)
         self.desired_instances = desired_instances
         if not 'spot_min_instances' in self.configuration['cluster']:
             self.configuration['cluster']['spot_min_instances'] = 0
@@ -74,12 +73,12 @@ class ClusterTemplateGenerator(TemplateGenerator):
         self._add_cluster()
         self._add_cluster_albs()
 
-        return to_yaml(json.dumps(self.template.to_dict(), cls=DecimalEncoder))
+        return self._template_to_yaml()
 
 
     def _setup_cloudmap(self):
         self.cloudmap = PrivateDnsNamespace(
-            camelcase("{self.env}Cloudmap".format(**locals())),
+            camelcase(f"{self.env}Cloudmap"),
             Name=Ref('AWS::StackName'),
             Vpc=Ref(self.vpc),
             Tags=Tags(
@@ -116,7 +115,7 @@ class ClusterTemplateGenerator(TemplateGenerator):
 
     def _create_vpc(self, cidr_block):
         self.vpc = VPC(
-            camelcase("{self.env}Vpc".format(**locals())),
+            camelcase(f"{self.env}Vpc"),
             CidrBlock=cidr_block,
             EnableDnsSupport=True,
             EnableDnsHostnames=True,
@@ -125,15 +124,15 @@ class ClusterTemplateGenerator(TemplateGenerator):
                 {'Key': 'category', 'Value': 'services'},
                 {'Key': 'environment', 'Value': self.env},
                 {'Key': 'Team', 'Value': self.team_name},
-                {'Key': 'Name', 'Value': "{self.env}-vpc".format(**locals())}]
+                {'Key': 'Name', 'Value': f"{self.env}-vpc"}]
         )
         self.template.add_resource(self.vpc)
         self.internet_gateway = InternetGateway(
-            camelcase("{self.env}Ig".format(**locals())),
+            camelcase(f"{self.env}Ig"),
             Tags=[
                 {
                     'Key': 'Name',
-                    'Value': "{self.env}-internet-gateway".format(**locals())
+                    'Value': f"{self.env}-internet-gateway"
                 },
                 {'Key': 'environment', 'Value': self.env},
                 {'Key': 'Team', 'Value': self.team_name}
@@ -141,7 +140,7 @@ class ClusterTemplateGenerator(TemplateGenerator):
         )
         self.template.add_resource(self.internet_gateway)
         vpc_gateway_attachment = VPCGatewayAttachment(
-            camelcase("{self.env}Attachment".format(**locals())),
+            camelcase(f"{self.env}Attachment"),
             InternetGatewayId=Ref(self.internet_gateway),
             VpcId=Ref(self.vpc)
         )
@@ -150,12 +149,12 @@ class ClusterTemplateGenerator(TemplateGenerator):
 
     def _create_public_network(self, subnet_configs):
         public_route_table = RouteTable(
-            camelcase("{self.env}Public".format(**locals())),
+            camelcase(f"{self.env}Public"),
             VpcId=Ref(self.vpc),
             Tags=[
                 {
                     'Key': 'Name',
-                    'Value': "{self.env}-public".format(**locals())
+                    'Value': f"{self.env}-public"
                 },
                 {'Key': 'environment', 'Value': self.env},
                 {'Key': 'Team', 'Value': self.team_name}
@@ -170,9 +169,9 @@ class ClusterTemplateGenerator(TemplateGenerator):
             else:
                 availability_zone = self.availability_zones[1]
 
-            subnet_title = camelcase("{self.env}Public".format(**locals())) + \
+            subnet_title = camelcase(f"{self.env}Public") + \
                 pascalcase(re.sub('[^a-zA-Z0-9*]', '', subnet_title))
-            subnet_name = "{self.env}-public-{subnet_count}".format(**locals())
+            subnet_name = f"{self.env}-public-{subnet_count}"
             subnet = Subnet(
                 subnet_title,
                 AvailabilityZone=availability_zone,
@@ -188,14 +187,14 @@ class ClusterTemplateGenerator(TemplateGenerator):
             self.public_subnets.append(subnet)
             self.template.add_resource(subnet)
             subnet_route_table_association = SubnetRouteTableAssociation(
-                camelcase("{self.env}PublicSubnet{subnet_count}Assoc".format(**locals())),
+                camelcase(f"{self.env}PublicSubnet{subnet_count}Assoc"),
                 RouteTableId=Ref(public_route_table),
                 SubnetId=Ref(subnet)
             )
             self.template.add_resource(subnet_route_table_association)
 
         internet_gateway_route = Route(
-            camelcase("{self.env}IgRoute".format(**locals())),
+            camelcase(f"{self.env}IgRoute"),
             DestinationCidrBlock='0.0.0.0/0',
             GatewayId=Ref(self.internet_gateway),
             RouteTableId=Ref(public_route_table)
@@ -205,12 +204,12 @@ class ClusterTemplateGenerator(TemplateGenerator):
 
     def _create_private_network(self, subnet_configs, eip_allocation_id):
         private_route_table = RouteTable(
-            camelcase("{self.env}Private".format(**locals())),
+            camelcase(f"{self.env}Private"),
             VpcId=Ref(self.vpc),
             Tags=[
                 {
                     'Key': 'Name',
-                    'Value': "{self.env}-private".format(**locals())
+                    'Value': f"{self.env}-private"
                 },
                 {'Key': 'environment', 'Value': self.env},
                 {'Key': 'Team', 'Value': self.team_name}
@@ -224,9 +223,9 @@ class ClusterTemplateGenerator(TemplateGenerator):
                 availability_zone = self.availability_zones[0]
             else:
                 availability_zone = self.availability_zones[1]
-            subnet_title = camelcase("{self.env}Private".format(**locals())) + \
+            subnet_title = camelcase(f"{self.env}Private") + \
                 pascalcase(re.sub('[^a-zA-Z0-9*]', '', subnet_title))
-            subnet_name = "{self.env}-private-{subnet_count}".format(**locals())
+            subnet_name = f"{self.env}-private-{subnet_count}"
             subnet = Subnet(
                 subnet_title,
                 AvailabilityZone=availability_zone,
@@ -242,21 +241,20 @@ class ClusterTemplateGenerator(TemplateGenerator):
             self.private_subnets.append(subnet)
             self.template.add_resource(subnet)
             subnet_route_table_association = SubnetRouteTableAssociation(
-                camelcase("{self.env}PrivateSubnet{subnet_count}Assoc".format(
-                    **locals())),
+                camelcase(f"{self.env}PrivateSubnet{subnet_count}Assoc"),
                 RouteTableId=Ref(private_route_table),
                 SubnetId=Ref(subnet)
             )
             self.template.add_resource(subnet_route_table_association)
 
         nat_gateway = NatGateway(
-            camelcase("{self.env}Nat".format(**locals())),
+            camelcase(f"{self.env}Nat"),
             AllocationId=eip_allocation_id,
             SubnetId=Ref(self.public_subnets[0]),
             Tags=[
                 {
                     'Key': 'Name',
-                    'Value': "{self.env}-nat-gateway".format(**locals())
+                    'Value': f"{self.env}-nat-gateway"
                 },
                 {'Key': 'environment', 'Value': self.env},
                 {'Key': 'Team', 'Value': self.team_name}
@@ -264,7 +262,7 @@ class ClusterTemplateGenerator(TemplateGenerator):
         )
         self.template.add_resource(nat_gateway)
         nat_gateway_route = Route(
-            camelcase("{self.env}NatRoute".format(**locals())),
+            camelcase(f"{self.env}NatRoute"),
             DestinationCidrBlock='0.0.0.0/0',
             NatGatewayId=Ref(nat_gateway),
             RouteTableId=Ref(private_route_table)
@@ -275,29 +273,28 @@ class ClusterTemplateGenerator(TemplateGenerator):
     def _create_database_subnet_group(self):
         database_subnet_group = DBSubnetGroup(
             "DBSubnetGroup",
-            DBSubnetGroupName="{self.env}-subnet".format(**locals()),
+            DBSubnetGroupName=f"{self.env}-subnet",
             Tags=[
                 {'Key': 'category', 'Value': 'services'},
                 {'Key': 'environment', 'Value': self.env},
                 {'Key': 'Team', 'Value': self.team_name}
             ],
-            DBSubnetGroupDescription="{self.env} subnet group".format(
-                **locals()),
+            DBSubnetGroupDescription=f"{self.env} subnet group",
             SubnetIds=[Ref(subnet) for subnet in self.private_subnets]
         )
         self.template.add_resource(database_subnet_group)
         elasticache_subnet_group = ElastiCacheSubnetGroup(
             "ElasticacheSubnetGroup",
-            CacheSubnetGroupName="{self.env}-subnet".format(**locals()),
-            Description="{self.env} subnet group".format(**locals()),
+            CacheSubnetGroupName=f"{self.env}-subnet",
+            Description=f"{self.env} subnet group",
             SubnetIds=[Ref(subnet) for subnet in self.private_subnets]
         )
         self.template.add_resource(elasticache_subnet_group)
 
     def _create_log_group(self):
         log_group = LogGroup(
-            camelcase("{self.env}LogGroup".format(**locals())),
-            LogGroupName="{self.env}-logs".format(**locals()),
+            camelcase(f"{self.env}LogGroup"),
+            LogGroupName=f"{self.env}-logs",
             RetentionInDays=365
         )
         self.template.add_resource(log_group)
@@ -309,15 +306,15 @@ class ClusterTemplateGenerator(TemplateGenerator):
     def _add_instance_profile(self):
         role_name = Sub('ecs-${AWS::StackName}-${AWS::Region}')
         assume_role_policy = {
-            u'Statement': [
+            'Statement': [
                 {
-                    u'Action': [
-                        u'sts:AssumeRole'
+                    'Action': [
+                        'sts:AssumeRole'
                     ],
-                    u'Effect': u'Allow',
-                    u'Principal': {
-                        u'Service': [
-                            u'ec2.amazonaws.com'
+                    'Effect': 'Allow',
+                    'Principal': {
+                        'Service': [
+                            'ec2.amazonaws.com'
                         ]
                     }
                 }
@@ -881,19 +878,19 @@ class ClusterTemplateGenerator(TemplateGenerator):
         self.template.add_output(Output(
             "CloudmapId",
             Description="CloudMap Namespace ID for service discovery",
-            Export=Export("{self.env}Cloudmap".format(**locals())),
+            Export=Export(f"{self.env}Cloudmap"),
             Value=GetAtt(self.cloudmap, 'Id'))
         )
         self.template.add_output(Output(
             "SecurityGroupEC2Host",
-            Export=Export("{self.env}Ec2Host".format(**locals())),
+            Export=Export(f"{self.env}Ec2Host"),
             Description="EC2Host Security group ID",
             Value=Ref('SecurityGroupEc2Hosts'))
         )
         if 'ecs_instance_default_lifecycle_type' in self.configuration['cluster']:
             self.template.add_output(Output(
                 "ECSClusterDefaultInstanceLifecycle",
-                Export=Export("{self.env}ECSClusterDefaultInstanceLifecycle".format(**locals())),
+                Export=Export(f"{self.env}ECSClusterDefaultInstanceLifecycle"),
                 Description="Default instance type for ECS cluster",
                 Value=str(self.configuration['cluster']['ecs_instance_default_lifecycle_type']))
             )
@@ -111,7 +111,7 @@ def wait_for_finish(action, existing_events, color):
 
 
 def fetch_events(service):
-    all_events = sorted(service.get(u'events'), key=lambda k: k['createdAt'])
+    all_events = sorted(service.get('events'), key=lambda k: k['createdAt'])
     return all_events
 
 
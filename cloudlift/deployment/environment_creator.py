@@ -123,12 +123,11 @@ class EnvironmentCreator(object):
             cfn_resources = cloudformation_client.list_stack_resources(
                 StackName=self.cluster_name
             )
-            auto_scaling_group_name = list(
-                filter(
-                    lambda x: x['ResourceType'] == "AWS::AutoScaling::AutoScalingGroup",
-                    cfn_resources['StackResourceSummaries']
-                )
-            )[0]['PhysicalResourceId']
+            auto_scaling_group_name = next(
+                resource['PhysicalResourceId']
+                for resource in cfn_resources['StackResourceSummaries']
+                if resource['ResourceType'] == "AWS::AutoScaling::AutoScalingGroup"
+            )
             response = auto_scaling_client.describe_auto_scaling_groups(
                 AutoScalingGroupNames=[auto_scaling_group_name]
             )
@@ -2,8 +2,9 @@ import json
 import re
 import uuid
 import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 
-import boto3
 from botocore.exceptions import ClientError
 from cloudlift.exceptions import UnrecoverableException
 from cloudlift.config import get_client_for
@@ -11,7 +12,6 @@ from cloudlift.config import get_client_for
 from awacs.aws import PolicyDocument, Statement, Allow, Principal
 from awacs.sts import AssumeRole
 from awacs.firehose import PutRecordBatch
-from cfn_flip import to_yaml
 from stringcase import pascalcase
 from troposphere import GetAtt, Output, Parameter, Ref, Sub, ImportValue, Tags
 from troposphere.cloudwatch import Alarm, MetricDimension
@@ -36,16 +36,54 @@ from troposphere.events import Rule, Target
 
 from cloudlift.config import region as region_service
 from cloudlift.config import get_account_id
-from cloudlift.config import DecimalEncoder, VERSION
+from cloudlift.config import VERSION, replace_decimals
 from cloudlift.config import get_service_stack_name
 from cloudlift.deployment.deployer import build_config
-from cloudlift.deployment.ecs import DeployAction, EcsClient
 from cloudlift.config.logging import log, log_bold
 from cloudlift.deployment.service_information_fetcher import ServiceInformationFetcher
 from cloudlift.deployment.template_generator import TemplateGenerator
 from cloudlift.constants import FLUENTBIT_FIRELENS_SIDECAR_CONTAINER_NAME
 from cloudlift.config.environment_configuration import EnvironmentConfiguration
 
+_NON_WORD_RE = re.compile(r'\W+')
+_CLUSTER_ALB_SG_OUTPUT_RE = re.compile(r'SG(Internal|Public)\d+ID')
+_CLUSTER_ALB_LISTENER_OUTPUT_RE = re.compile(r'ListenerHTTPS?(Internal|Public)\d+ARN')
+_ECS_TASKS_PRINCIPAL = Principal("Service", ["ecs-tasks.amazonaws.com"])
+_ASSUME_ROLE_STATEMENT = Statement(
+    Effect=Allow,
+    Action=[AssumeRole],
+    Principal=_ECS_TASKS_PRINCIPAL
+)
+_ECS_ASSUME_ROLE_POLICY = {
+    'Statement': [
+        {
+            'Action': ['sts:AssumeRole'],
+            'Effect': 'Allow',
+            'Principal': {
+                'Service': ['ecs.amazonaws.com']
+            }
+        }
+    ]
+}
+_TARGET_GROUP_ATTRIBUTES = [
+    TargetGroupAttribute(
+        Key='deregistration_delay.timeout_seconds',
+        Value='30'
+    )
+]
+_HTTP_TO_HTTPS_REDIRECT_ACTION = Action(
+    RedirectConfig=RedirectConfig(
+        StatusCode='HTTP_301',
+        Protocol='HTTPS',
+        Port='443'
+    ),
+    Type="redirect"
+)
+
+
+_DESCRIBE_SERVICES_BATCH_SIZE = 10
+
+
 class ServiceTemplateGenerator(TemplateGenerator):
     PLACEMENT_STRATEGIES = [
         PlacementStrategy(
@@ -58,6 +96,34 @@ class ServiceTemplateGenerator(TemplateGenerator):
         )]
     LAUNCH_TYPE_FARGATE = 'FARGATE'
     LAUNCH_TYPE_EC2 = 'EC2'
+    # (title prefix, metric name, threshold, description)
+    ALB_ALARMS = [
+        ('ElbUnhealthyHostAlarm', 'UnHealthyHostCount', '1',
+         'Triggers if any host is marked unhealthy'),
+        ('ElbRejectedConnectionsAlarm', 'RejectedConnectionCount', '1',
+         'Triggers if load balancer has rejected connections because the load \
+balancer had reached its maximum number of connections.'),
+        ('ElbHTTPCodeELB5xxAlarm', 'HTTPCode_ELB_5XX_Count', '3',
+         'Triggers if 5xx response originated from load balancer'),
+    ]
+    ECS_SERVICE_ALARM_DEFAULTS = {
+        'EvaluationPeriods': 1,
+        'Namespace': 'AWS/ECS',
+        'Period': 300,
+        'ComparisonOperator': 'GreaterThanThreshold',
+        'Statistic': 'Average'
+    }
+    ALB_ALARM_DEFAULTS = {
+        'EvaluationPeriods': 1,
+        'Namespace': 'AWS/ApplicationELB',
+        'Period': 60,
+        'ComparisonOperator': 'GreaterThanOrEqualToThreshold',
+        'Statistic': 'Sum',
+        'TreatMissingData': 'notBreaching'
+    }
+    _ECS_TASKS_ASSUME_ROLE = PolicyDocument(
+        Statement=[_ASSUME_ROLE_STATEMENT]
+    )
 
     def __init__(self, service_configuration, environment_stack):
         super(ServiceTemplateGenerator, self).__init__(
@@ -66,32 +132,46 @@ class ServiceTemplateGenerator(TemplateGenerator):
         self._derive_configuration(service_configuration)
         self.env_sample_file_path = './env.sample'
         self.environment_stack = environment_stack
-        self.current_version = ServiceInformationFetcher(
-            self.application_name, self.env).get_current_version()
         self.bucket_name = 'cloudlift-service-template'
         self.environment = service_configuration.environment
         self.client = get_client_for('s3', self.environment)
         self.team_name = (self.notifications_arn.split(':')[-1])
+        self.env_pascalcase = pascalcase(self.env)
+        self.default_tags = Tags(Team=self.team_name, environment=self.env)
         self.environment_configuration = EnvironmentConfiguration(self.environment).get_config().get(self.environment, {})
         self.service_defaults = self.environment_configuration.get('service_defaults', {})
         self.cluster_alb_listeners: list = []
+        self.cluster_name_dimension = MetricDimension(
+            Name='ClusterName',
+            Value=self.cluster_name
+        )
+        self.firelens_policy_document = PolicyDocument(
+            Statement=[
+                Statement(
+                    Effect=Allow,
+                    Action=[AssumeRole],
+                    Resource=[self.service_defaults.get('env', {}).get('kinesis_role_arn') or "*"],
+                )
+            ]
+        )
 
     def _derive_configuration(self, service_configuration):
         self.application_name = service_configuration.service_name
-        self.configuration = service_configuration.get_config(VERSION)
+        self.configuration = replace_decimals(service_configuration.get_config(VERSION))
 
     def generate_service(self):
+        self._fetch_service_information()
         self._add_service_parameters()
         self._add_service_outputs()
-        self._fetch_current_desired_count()
         self._add_ecs_service_iam_role()
         self._add_cluster_services()
 
+        template_body = self._template_to_yaml()
         key = uuid.uuid4().hex + '.yml'
-        if len(to_yaml(self.template.to_json())) > 51000:
+        if len(template_body) > 51000:
             try:
                 self.client.put_object(
-                    Body=to_yaml(self.template.to_json()),
+                    Body=template_body,
                     Bucket=self.bucket_name,
                     Key=key,
                 )
@@ -104,21 +184,33 @@ class ServiceTemplateGenerator(TemplateGenerator):
                 else:
                     raise boto_client_error
         else:
-            return to_yaml(self.template.to_json()), 'TemplateBody', ''
+            return template_body, 'TemplateBody', ''
 
     def _add_cluster_services(self):
+        env_config = build_config(
+            self.env,
+            self.application_name,
+            self.env_sample_file_path
+        )
         for ecs_service_name, config in self.configuration['services'].items():
-            self._add_service(ecs_service_name, config)
+            self._add_service(ecs_service_name, config, env_config)
 
     def _add_service_alarms(self, svc):
+        service_dimensions = [
+            self.cluster_name_dimension,
+            MetricDimension(
+                Name='ServiceName',
+                Value=GetAtt(svc, 'Name')
+            )
+        ]
         oom_event_rule = Rule(
-            'EcsOOM' + str(svc.name),
+            f'EcsOOM{svc.name}',
             Description="Triggered when an Amazon ECS Task is stopped",
             EventPattern={
                 "detail-type": ["ECS Task State Change"],
                 "source": ["aws.ecs"],
                 "detail": {
-                    "clusterArn": [{"anything-but": [str(self.cluster_name)]}],
+                    "clusterArn": [{"anything-but": [self.cluster_name]}],
                     "containers": {
                         "reason": [{
                             "prefix": "OutOfMemory"
@@ -127,89 +219,42 @@ class ServiceTemplateGenerator(TemplateGenerator):
                     "desiredStatus": ["STOPPED"],
                     "lastStatus": ["STOPPED"],
                     "taskDefinitionArn": [{
-                        "anything-but": [str(svc.name) + "Family"]
+                        "anything-but": [f"{svc.name}Family"]
                     }]
                 }
             },
             State="ENABLED",
             Targets=[Target(
-                    Arn=Ref(self.notification_sns_arn),
+                    Arn=self.notification_sns_arn_ref,
                     Id="ECSOOMStoppedTasks",
                     InputPath="$.detail.containers[0]"
                 )
             ]
         )
-        self.template.add_resource(oom_event_rule)
-
-        ecs_high_cpu_alarm = Alarm(
-            'EcsHighCPUAlarm' + str(svc.name),
-            EvaluationPeriods=1,
-            Dimensions=[
-                MetricDimension(
-                    Name='ClusterName',
-                    Value=self.cluster_name
-                ),
-                MetricDimension(
-                    Name='ServiceName',
-                    Value=GetAtt(svc, 'Name')
-                )],
-            AlarmActions=[Ref(self.notification_sns_arn)],
-            OKActions=[Ref(self.notification_sns_arn)],
+
+        ecs_high_cpu_alarm = self._ecs_service_alarm(
+            f'EcsHighCPUAlarm{svc.name}',
+            service_dimensions,
             AlarmDescription='Alarm if CPU too high or metric disappears \
 indicating instance is down',
-            Namespace='AWS/ECS',
-            Period=300,
-            ComparisonOperator='GreaterThanThreshold',
-            Statistic='Average',
             Threshold='80',
             MetricName='CPUUtilization'
         )
-        self.template.add_resource(ecs_high_cpu_alarm)
-        ecs_high_memory_alarm = Alarm(
-            'EcsHighMemoryAlarm' + str(svc.name),
-            EvaluationPeriods=1,
-            Dimensions=[
-                MetricDimension(
-                    Name='ClusterName',
-                    Value=self.cluster_name
-                ),
-                MetricDimension(
-                    Name='ServiceName',
-                    Value=GetAtt(svc, 'Name')
-                )
-            ],
-            AlarmActions=[Ref(self.notification_sns_arn)],
-            OKActions=[Ref(self.notification_sns_arn)],
+        ecs_high_memory_alarm = self._ecs_service_alarm(
+            f'EcsHighMemoryAlarm{svc.name}',
+            service_dimensions,
             AlarmDescription='Alarm if memory too high or metric \
 disappears indicating instance is down',
-            Namespace='AWS/ECS',
-            Period=300,
-            ComparisonOperator='GreaterThanThreshold',
-            Statistic='Average',
             Threshold='120',
             MetricName='MemoryUtilization'
         )
-        self.template.add_resource(ecs_high_memory_alarm)
         # How to add service task count alarm
         # http://docs.aws.amazon.com/AmazonECS/latest/developerguide/cloudwatch-metrics.html#cw_running_task_count
-        ecs_no_running_tasks_alarm = Alarm(
-            'EcsNoRunningTasksAlarm' + str(svc.name),
-            EvaluationPeriods=1,
-            Dimensions=[
-                MetricDimension(
-                    Name='ClusterName',
-                    Value=self.cluster_name
-                ),
-                MetricDimension(
-                    Name='ServiceName',
-                    Value=GetAtt(svc, 'Name')
-                )
-            ],
-            AlarmActions=[Ref(self.notification_sns_arn)],
-            OKActions=[Ref(self.notification_sns_arn)],
+        ecs_no_running_tasks_alarm = self._ecs_service_alarm(
+            f'EcsNoRunningTasksAlarm{svc.name}',
+            service_dimensions,
             AlarmDescription='Alarm if the task count goes to zero, denoting \
 service is down',
-            Namespace='AWS/ECS',
             Period=60,
             ComparisonOperator='LessThanThreshold',
             Statistic='SampleCount',
@@ -217,51 +262,54 @@ service is down',
             MetricName='CPUUtilization',
             TreatMissingData='breaching'
         )
-        self.template.add_resource(ecs_no_running_tasks_alarm)
-
-    def _add_service(self, service_name, config):
-        launch_type = self.LAUNCH_TYPE_FARGATE if 'fargate' in config else self.LAUNCH_TYPE_EC2
-        env_config = build_config(
-            self.env,
-            self.application_name,
-            self.env_sample_file_path
+        self.template.add_resource([
+            oom_event_rule,
+            ecs_high_cpu_alarm,
+            ecs_high_memory_alarm,
+            ecs_no_running_tasks_alarm
+        ])
+
+    def _ecs_service_alarm(self, title, dimensions, **alarm_args):
+        return Alarm(
+            title,
+            Dimensions=dimensions,
+            AlarmActions=self.notification_actions,
+            OKActions=self.notification_actions,
+            **{**self.ECS_SERVICE_ALARM_DEFAULTS, **alarm_args}
         )
+
+    def _add_service(self, service_name, config, env_config):
+        http_interface = config.get('http_interface')
+        container_port = int(http_interface['container_port']) if http_interface else None
+        is_fargate = 'fargate' in config
+        custom_metrics = config.get('custom_metrics')
+        volume = config.get('volume')
+        launch_type = self.LAUNCH_TYPE_FARGATE if is_fargate else self.LAUNCH_TYPE_EC2
         container_definition_arguments = {
             "Secrets": [
                 Secret(Name=k, ValueFrom=v) for (k, v) in env_config
             ],
-            "Name": service_name + "Container",
-            "Image": self.ecr_image_uri + ':' + self.current_version,
+            "Name": f"{service_name}Container",
+            "Image": self.container_image,
             "Essential": 'true',
             "Cpu": 0
         }
         placement_constraint = {}
-        if 'fargate' not in config:
-            for key in self.environment_stack["Outputs"]:
-                if key["OutputKey"] == 'ECSClusterDefaultInstanceLifecycle':
-                    instance_lifecycle = key["OutputValue"]
-                    spot_deployment = instance_lifecycle == 'spot'
-                    placement_constraint = {
-                        "PlacementConstraints": [PlacementConstraint(
-                            Type='memberOf',
-                            Expression='attribute:deployment_type == spot' if spot_deployment else 'attribute:deployment_type == ondemand'
-                        )],
-                    }
-            if 'spot_deployment' in config:
-                spot_deployment = config["spot_deployment"]
+        if not is_fargate:
+            instance_lifecycle = self.environment_outputs.get('ECSClusterDefaultInstanceLifecycle')
+            if 'spot_deployment' in config or instance_lifecycle is not None:
+                spot_deployment = config.get('spot_deployment', instance_lifecycle == 'spot')
                 placement_constraint = {
-                    "PlacementConstraints" : [PlacementConstraint(
+                    "PlacementConstraints": [PlacementConstraint(
                         Type='memberOf',
                         Expression='attribute:deployment_type == spot' if spot_deployment else 'attribute:deployment_type == ondemand'
                     )],
                 }
 
-        if 'http_interface' in config:
+        if http_interface:
             container_definition_arguments['PortMappings'] = [
                 PortMapping(
-                    ContainerPort=int(
-                        config['http_interface']['container_port']
-                    )
+                    ContainerPort=container_port
                 )
             ]
 
@@ -272,54 +320,37 @@ service is down',
                 # This assignment ensures 'config' has the default logging key for future operations
                 config['logging'] = default_logging 
 
-        if 'logging' not in config or 'logging' in config and config['logging'] is not None:
-            log_type = "awslogs" if 'logging' not in config else config['logging']
+        log_type = config.get('logging', 'awslogs')
+        if log_type is not None:
             container_definition_arguments['LogConfiguration'] = self._gen_log_config(service_name, log_type)
 
         if config['command'] is not None:
             container_definition_arguments['Command'] = [config['command']]
 
-        if 'volume' in config:
+        if volume:
             container_definition_arguments['MountPoints'] = [MountPoint(
-                SourceVolume=service_name + '-efs-volume',
-                ContainerPath=config['volume']['container_path']
+                SourceVolume=f'{service_name}-efs-volume',
+                ContainerPath=volume['container_path']
             )]
         if launch_type == self.LAUNCH_TYPE_EC2:
-            container_definition_arguments['MemoryReservation'] = int(config['memory_reservation'])
-            container_definition_arguments['Memory'] = int(config['memory_reservation']) + -(-(int(config['memory_reservation']) * 50 )//100) # Celling the value
+            memory_reservation = int(config['memory_reservation'])
+            container_definition_arguments['MemoryReservation'] = memory_reservation
+            container_definition_arguments['Memory'] = memory_reservation + -(-(memory_reservation * 50)//100) # Celling the value
 
         cd = ContainerDefinition(**self._firelens_container_def_args_override(config, container_definition_arguments))
 
         task_role_args = {}
         if config.get("logging") == "awsfirelens":
-            service_defaults = self.environment_configuration.get('service_defaults', {})
-            assume_role_resource = service_defaults.get('env', {}).get('kinesis_role_arn')
             task_role_args["Policies"] = [
                 Policy(
-                    PolicyName=service_name + "-Firelens",
-                    PolicyDocument=PolicyDocument(
-                        Statement=[
-                            Statement(
-                                Effect=Allow,
-                                Action=[AssumeRole],
-                                Resource=[assume_role_resource or "*"],
-                            )
-                        ]
-                    ),
+                    PolicyName=f"{service_name}-Firelens",
+                    PolicyDocument=self.firelens_policy_document,
                 )
             ]
 
         task_role = self.template.add_resource(Role(
-            service_name + "Role",
-            AssumeRolePolicyDocument=PolicyDocument(
-                Statement=[
-                    Statement(
-                        Effect=Allow,
-                        Action=[AssumeRole],
-                        Principal=Principal("Service", ["ecs-tasks.amazonaws.com"])
-                    )
-                ]
-            ),
+            f"{service_name}Role",
+            AssumeRolePolicyDocument=self._ECS_TASKS_ASSUME_ROLE,
             **task_role_args
         ))
 
@@ -327,35 +358,34 @@ service is down',
         if launch_type == self.LAUNCH_TYPE_FARGATE:
             launch_type_td = {
                 'RequiresCompatibilities': ['FARGATE'],
-                'NetworkMode': 'awsvpc',
                 'Cpu': str(config['fargate']['cpu']),
                 'Memory': str(config['fargate']['memory'])
             }
-
-        if 'custom_metrics' in config:
+        if launch_type == self.LAUNCH_TYPE_FARGATE or custom_metrics:
             launch_type_td['NetworkMode'] = 'awsvpc'
-        if 'volume' in config:
+        if volume:
             launch_type_td['Volumes'] = [Volume(
-                Name=service_name + '-efs-volume',
+                Name=f'{service_name}-efs-volume',
                 EFSVolumeConfiguration=EFSVolumeConfiguration(
-                    FilesystemId=config['volume']['efs_id'],
-                    RootDirectory=config['volume']['efs_directory_path']
+                    FilesystemId=volume['efs_id'],
+                    RootDirectory=volume['efs_directory_path']
                 )
             )]
 
         sidecar_container_defs = self._sidecar_container_defs(config, service_name)
         td = TaskDefinition(
-            service_name + "TaskDefinition",
-            Family=service_name + "Family",
-            ContainerDefinitions=[cd] + sidecar_container_defs,
-            ExecutionRoleArn=boto3.resource('iam').Role('ecsTaskExecutionRole').arn,
+            f"{service_name}TaskDefinition",
+            Family=f"{service_name}Family",
+            ContainerDefinitions=[cd, *sidecar_container_defs],
+            ExecutionRoleArn=self.execution_role_arn,
             TaskRoleArn=Ref(task_role),
-            Tags=Tags(Team=self.team_name, environment=self.env),
+            Tags=self.default_tags,
             **launch_type_td
         )
-        if 'custom_metrics' in config:
+        sd = None
+        if custom_metrics:
             sd = SD(
-                service_name + "ServiceRegistry",
+                f"{service_name}ServiceRegistry",
                 DnsConfig=DnsConfig(
                     RoutingPolicy="MULTIVALUE",
                     DnsRecords=[DnsRecord(
@@ -363,97 +393,25 @@ service is down',
                         Type="SRV"
                     )],
                     NamespaceId=ImportValue(
-                    "{self.env}Cloudmap".format(**locals()))
+                    f"{self.env}Cloudmap")
                 ),
                 Tags=Tags(
-                    {'METRICS_PATH': config['custom_metrics']['metrics_path']},
-                    {'METRICS_PORT': config['custom_metrics']['metrics_port']}
+                    {'METRICS_PATH': custom_metrics['metrics_path']},
+                    {'METRICS_PORT': custom_metrics['metrics_port']}
                 )
             )
             self.template.add_resource(sd)
 
         self.template.add_resource(td)
-        desired_count = self._get_desired_task_count_for_service(service_name)
-        deployment_configuration = DeploymentConfiguration(
-            MinimumHealthyPercent=100,
-            MaximumPercent=200
-        )
-        if 'http_interface' in config:
-            http_interface = config.get('http_interface', {})
+        desired_count = self.desired_counts.get(service_name, 0)
+        if http_interface:
             # if no environment default is set, fallback to 'dedicated'
             environment_default_alb_mode = self.service_defaults.get('alb_mode', 'dedicated')
             # if 'alb_mode' not in http_interface, then fallback to environment default
             alb_mode = http_interface.get('alb_mode', environment_default_alb_mode)
 
-            alb, lb, service_listener, alb_sg, cluster_alb_listener_rules = self._add_alb(cd, service_name, config, launch_type, alb_mode)
-
-            if launch_type == self.LAUNCH_TYPE_FARGATE:
-                # if launch type is ec2, then services inherit the ec2 instance security group
-                # otherwise, we need to specify a security group for the service
-                launch_type_svc = {}
-                if 'custom_metrics' in config:
-                    launch_type_svc = {
-                        "ServiceRegistries": [ServiceRegistry(
-                            RegistryArn=GetAtt(sd, 'Arn'),
-                            Port=int(
-                                config['custom_metrics']['metrics_port'])
-                        )]
-                    }
-                else:
-                    service_security_group = SecurityGroup(
-                        pascalcase("FargateService" + self.env + service_name),
-                        GroupName=pascalcase("FargateService" + self.env + service_name),
-                        SecurityGroupIngress=[{
-                            'IpProtocol': 'TCP',
-                            # alb_sg is either a string i.e. the security group id or a tropsphere SecurityGroup object
-                            'SourceSecurityGroupId': alb_sg if isinstance(alb_sg, str) else Ref(alb_sg),
-                            'ToPort': int(config['http_interface']['container_port']),
-                            'FromPort': int(config['http_interface']['container_port']),
-                        }],
-                        VpcId=Ref(self.vpc),
-                        GroupDescription=pascalcase("FargateService" + self.env + service_name),
-                        Tags=Tags(Team=self.team_name, environment=self.env)
-                    )
-                    self.template.add_resource(service_security_group)
-
-                launch_type_svc['NetworkConfiguration'] = NetworkConfiguration(
-                    AwsvpcConfiguration=AwsvpcConfiguration(
-                        Subnets=[
-                            Ref(self.private_subnet1),
-                            Ref(self.private_subnet2)
-                        ],
-                        SecurityGroups=[
-                            ImportValue("{self.env}Ec2Host".format(**locals())) if 'custom_metrics' in config else Ref(service_security_group)
-                        ]
-                    )
-                )
-            else:
-                if 'custom_metrics' in config:
-                    launch_type_svc = {
-                        "ServiceRegistries": [ServiceRegistry(
-                            RegistryArn=GetAtt(sd, 'Arn'),
-                            Port=int(
-                                config['custom_metrics']['metrics_port'])
-                        )],
-                        "NetworkConfiguration": NetworkConfiguration(
-                            AwsvpcConfiguration=AwsvpcConfiguration(
-                                SecurityGroups=[
-                                    ImportValue(
-                                        "{self.env}Ec2Host".format(**locals()))
-                                ],
-                                Subnets=[
-                                    Ref(self.private_subnet1),
-                                    Ref(self.private_subnet2)
-                                ]
-                            )
-                        ),
-                        'PlacementStrategies': self.PLACEMENT_STRATEGIES
-                    }
-                else:
-                    launch_type_svc = {
-                        'Role': Ref(self.ecs_service_role),
-                        'PlacementStrategies': self.PLACEMENT_STRATEGIES
-                    }
+            alb, lb, service_listener, alb_sg, cluster_alb_listener_rules = self._add_alb(cd, service_name, config, launch_type, alb_mode, container_port)
+
             service_dependencies = []
 
             if service_listener:
@@ -465,127 +423,49 @@ service is down',
                     [rule.title for rule in cluster_alb_listener_rules]
                 )
 
-            svc = Service(
-                service_name,
-                LoadBalancers=[lb],
-                Cluster=self.cluster_name,
-                TaskDefinition=Ref(td),
-                DesiredCount=desired_count,
-                LaunchType=launch_type,
-                **launch_type_svc,
-                Tags=Tags(Team=self.team_name, environment=self.env),
-                **placement_constraint,
-                DependsOn=service_dependencies
-            )
-            self.template.add_output(
-                Output(
-                    service_name + 'EcsServiceName',
-                    Description='The ECS name which needs to be entered',
-                    Value=GetAtt(svc, 'Name')
-                )
-            )
+            service_args = {
+                'LoadBalancers': [lb],
+                'DependsOn': service_dependencies
+            }
             if isinstance(alb, ALBLoadBalancer):
                 self.template.add_output(
                     Output(
-                        service_name + "URL",
+                        f"{service_name}URL",
                         Description="The URL at which the service is accessible",
-                        Value=Sub("https://${" + alb.name + ".DNSName}")
+                        Value=Sub("https://${DNSName}", DNSName=GetAtt(alb, "DNSName"))
                     )
                 )
-            self.template.add_resource(svc)
         else:
-            launch_type_svc = {}
-            if launch_type == self.LAUNCH_TYPE_FARGATE:
-                # if launch type is ec2, then services inherit the ec2 instance security group
-                # otherwise, we need to specify a security group for the service
-                if 'custom_metrics' in config:
-                    launch_type_svc = {
-                        "ServiceRegistries": [ServiceRegistry(
-                            RegistryArn=GetAtt(sd, 'Arn'),
-                            Port=int(
-                                config['custom_metrics']['metrics_port'])
-                        )],
-                        'NetworkConfiguration': NetworkConfiguration(
-                            AwsvpcConfiguration=AwsvpcConfiguration(
-                                Subnets=[
-                                    Ref(self.private_subnet1),
-                                    Ref(self.private_subnet2)
-                                ],
-                                SecurityGroups=[
-                                    ImportValue(
-                                        "{self.env}Ec2Host".format(**locals()))
-                                ]
-                            )
-                        )
-                    }
-                else:
-                    service_security_group = SecurityGroup(
-                        pascalcase("FargateService" + self.env + service_name),
-                        GroupName=pascalcase("FargateService" + self.env + service_name),
-                        SecurityGroupIngress=[],
-                        VpcId=Ref(self.vpc),
-                        GroupDescription=pascalcase("FargateService" + self.env + service_name),
-                        Tags=Tags(Team=self.team_name, environment=self.env)
-                    )
-                    self.template.add_resource(service_security_group)
-                    launch_type_svc = {
-                        'NetworkConfiguration': NetworkConfiguration(
-                            AwsvpcConfiguration=AwsvpcConfiguration(
-                                Subnets=[
-                                    Ref(self.private_subnet1),
-                                    Ref(self.private_subnet2)
-                                ],
-                                SecurityGroups=[
-                                    Ref(service_security_group)
-                                ]
-                            )
-                        )
-                    }
-            else:
-                if 'custom_metrics' in config:
-                    launch_type_svc = {
-                        "ServiceRegistries": [ServiceRegistry(
-                            RegistryArn=GetAtt(sd, 'Arn'),
-                            Port=int(
-                                config['custom_metrics']['metrics_port'])
-                        )],
-                        "NetworkConfiguration": NetworkConfiguration(
-                            AwsvpcConfiguration=AwsvpcConfiguration(
-                                SecurityGroups=[
-                                    ImportValue(
-                                        "{self.env}Ec2Host".format(**locals()))
-                                ],
-                                Subnets=[
-                                    Ref(self.private_subnet1),
-                                    Ref(self.private_subnet2)
-                                ]
-                            )
-                        ),
-                        'PlacementStrategies': self.PLACEMENT_STRATEGIES
-                    }
-                else:
-                    launch_type_svc = {
-                        'PlacementStrategies': self.PLACEMENT_STRATEGIES
-                    }
-            svc = Service(
-                service_name,
-                Cluster=self.cluster_name,
-                TaskDefinition=Ref(td),
-                DesiredCount=desired_count,
-                DeploymentConfiguration=deployment_configuration,
-                LaunchType=launch_type,
-                **launch_type_svc,
-                Tags=Tags(Team=self.team_name, environment=self.env),
-                **placement_constraint
-            )
-            self.template.add_output(
-                Output(
-                    service_name + 'EcsServiceName',
-                    Description='The ECS name which needs to be entered',
-                    Value=GetAtt(svc, 'Name')
+            alb_sg = None
+            service_args = {
+                'DeploymentConfiguration': DeploymentConfiguration(
+                    MinimumHealthyPercent=100,
+                    MaximumPercent=200
                 )
+            }
+
+        launch_type_svc = self._launch_type_service_args(
+            service_name, launch_type, custom_metrics, sd, bool(http_interface), alb_sg, container_port
+        )
+        svc = Service(
+            service_name,
+            Cluster=self.cluster_name,
+            TaskDefinition=Ref(td),
+            DesiredCount=desired_count,
+            LaunchType=launch_type,
+            **service_args,
+            **launch_type_svc,
+            Tags=self.default_tags,
+            **placement_constraint
+        )
+        self.template.add_output(
+            Output(
+                f'{service_name}EcsServiceName',
+                Description='The ECS name which needs to be entered',
+                Value=GetAtt(svc, 'Name')
             )
-            self.template.add_resource(svc)
+        )
+        self.template.add_resource(svc)
 
         default_disable_service_alarms = self.service_defaults.get('disable_service_alarms', False)
         is_alarms_disabled = config.get('disable_service_alarms', default_disable_service_alarms)
@@ -593,6 +473,61 @@ service is down',
         if not is_alarms_disabled:
             self._add_service_alarms(svc)
 
+    def _launch_type_service_args(self, service_name, launch_type, custom_metrics, service_registry, is_http, alb_sg, container_port):
+        if custom_metrics:
+            launch_type_svc = {
+                "ServiceRegistries": [ServiceRegistry(
+                    RegistryArn=GetAtt(service_registry, 'Arn'),
+                    Port=int(custom_metrics['metrics_port'])
+                )],
+                "NetworkConfiguration": self._awsvpc_network_configuration(
+                    ImportValue(f"{self.env}Ec2Host")
+                )
+            }
+        elif launch_type == self.LAUNCH_TYPE_FARGATE:
+            # if launch type is ec2, then services inherit the ec2 instance security group
+            # otherwise, we need to specify a security group for the service
+            service_security_group_name = pascalcase(f"FargateService{self.env}{service_name}")
+            service_security_group_ingress = []
+            if is_http:
+                service_security_group_ingress.append({
+                    'IpProtocol': 'TCP',
+                    # alb_sg is either a string i.e. the security group id or a tropsphere SecurityGroup object
+                    'SourceSecurityGroupId': alb_sg if isinstance(alb_sg, str) else Ref(alb_sg),
+                    'ToPort': container_port,
+                    'FromPort': container_port,
+                })
+            service_security_group = SecurityGroup(
+                service_security_group_name,
+                GroupName=service_security_group_name,
+                SecurityGroupIngress=service_security_group_ingress,
+                VpcId=Ref(self.vpc),
+                GroupDescription=service_security_group_name,
+                Tags=self.default_tags
+            )
+            self.template.add_resource(service_security_group)
+            launch_type_svc = {
+                'NetworkConfiguration': self._awsvpc_network_configuration(
+                    Ref(service_security_group)
+                )
+            }
+        elif is_http:
+            launch_type_svc = {'Role': Ref(self.ecs_service_role)}
+        else:
+            launch_type_svc = {}
+
+        if launch_type == self.LAUNCH_TYPE_EC2:
+            launch_type_svc['PlacementStrategies'] = self.PLACEMENT_STRATEGIES
+        return launch_type_svc
+
+    def _awsvpc_network_configuration(self, security_group):
+        return NetworkConfiguration(
+            AwsvpcConfiguration=AwsvpcConfiguration(
+                Subnets=self.private_subnet_refs,
+                SecurityGroups=[security_group]
+            )
+        )
+
     def _gen_log_config(self, service_name, config):
         if config == 'awslogs':
             return LogConfiguration(
@@ -620,18 +555,20 @@ service is down',
             LogDriver="none"
         )
 
-    def _add_alb(self, cd, service_name, config, launch_type, alb_mode):
+    def _add_alb(self, cd, service_name, config, launch_type, alb_mode, container_port):
         cluster_alb_listener_rules = None # default value
-        target_group_name = "TargetGroup" + service_name
+        target_group_name = f"TargetGroup{service_name}"
         if alb_mode == 'cluster':
             # suffix 'Cluster' denotes that the target group is for a cluster ALB
-            target_group_name = target_group_name + 'Cluster'
+            target_group_name += 'Cluster'
 
-        health_check_path = config['http_interface']['health_check_path'] if 'health_check_path' in config['http_interface'] else "/elb-check"
-        alb_scheme = 'internal' if config['http_interface']['internal'] else 'internet-facing'
+        http_interface = config['http_interface']
+        is_alb_internal = http_interface['internal']
+        health_check_path = http_interface.get('health_check_path', "/elb-check")
+        alb_scheme = 'internal' if is_alb_internal else 'internet-facing'
 
         if alb_scheme == 'internal':
-            target_group_name = target_group_name + 'Internal'
+            target_group_name += 'Internal'
 
         target_group_config = {}
         if launch_type == self.LAUNCH_TYPE_FARGATE or 'custom_metrics' in config:
@@ -642,16 +579,11 @@ service is down',
             HealthCheckPath=health_check_path,
             HealthyThresholdCount=2,
             HealthCheckIntervalSeconds=30,
-            TargetGroupAttributes=[
-                TargetGroupAttribute(
-                    Key='deregistration_delay.timeout_seconds',
-                    Value='30'
-                )
-            ],
+            TargetGroupAttributes=_TARGET_GROUP_ATTRIBUTES,
             VpcId=Ref(self.vpc),
             Protocol="HTTP",
             Matcher=Matcher(HttpCode="200-399"),
-            Port=int(config['http_interface']['container_port']),
+            Port=container_port,
             HealthCheckTimeoutSeconds=10,
             UnhealthyThresholdCount=3,
             **target_group_config,
@@ -672,71 +604,52 @@ service is down',
         lb = LoadBalancer(
             ContainerName=cd.Name,
             TargetGroupArn=Ref(service_target_group),
-            ContainerPort=int(config['http_interface']['container_port'])
+            ContainerPort=container_port
         )
 
         if alb_mode == 'dedicated':
-            sg_name = 'SG' + self.env + service_name
+            sg_name = f'SG{self.env}{service_name}'
             svc_alb_sg = SecurityGroup(
-                re.sub(r'\W+', '', sg_name),
-                GroupName=self.env + '-' + service_name,
+                _NON_WORD_RE.sub('', sg_name),
+                GroupName=f'{self.env}-{service_name}',
                 SecurityGroupIngress=self._generate_alb_security_group_ingress(
                     config
                 ),
                 VpcId=Ref(self.vpc),
-                GroupDescription=Sub(service_name + "-alb-sg"),
-                Tags=Tags(Team=self.team_name, environment=self.env)
+                GroupDescription=Sub(f"{service_name}-alb-sg"),
+                Tags=self.default_tags
             )
             self.template.add_resource(svc_alb_sg)
-            alb_name = service_name + pascalcase(self.env)
-            if config['http_interface']['internal']:
-                alb_subnets = [
-                    Ref(self.private_subnet1),
-                    Ref(self.private_subnet2)
-                ]
+            alb_name = f'{service_name}{self.env_pascalcase}'
+            alb_args = {}
+            if is_alb_internal:
+                alb_subnets = self.private_subnet_refs
                 scheme = "internal"
                 if len(alb_name) > 32:
-                    alb_name = service_name[:32-len(self.env[:4])-len(scheme)] + \
-                        pascalcase(self.env)[:4] + "Internal"
+                    alb_name = f'{service_name[:32-len(self.env[:4])-len(scheme)]}' \
+                        f'{self.env_pascalcase[:4]}Internal'
                 else:
-                    alb_name += 'Internal'
-                    alb_name = alb_name[:32]
-                alb = ALBLoadBalancer(
-                    'ALB' + service_name,
-                    Subnets=alb_subnets,
-                    SecurityGroups=[
-                        self.alb_security_group,
-                        Ref(svc_alb_sg)
-                    ],
-                    Name=alb_name,
-                    Tags=[
-                        {'Value': alb_name, 'Key': 'Name'},
-                        {"Key": "Team", "Value": self.team_name},
-                        {'Key': 'environment', 'Value': self.env}
-                    ],
-                    Scheme=scheme
-                )
+                    alb_name = f'{alb_name}Internal'[:32]
+                alb_args['Scheme'] = scheme
             else:
-                alb_subnets = [
-                    Ref(self.public_subnet1),
-                    Ref(self.public_subnet2)
-                ]
+                alb_subnets = self.public_subnet_refs
                 if len(alb_name) > 32:
-                    alb_name = service_name[:32-len(self.env)] + pascalcase(self.env)
-                alb = ALBLoadBalancer(
-                    'ALB' + service_name,
-                    Subnets=alb_subnets,
-                    SecurityGroups=[
-                        self.alb_security_group,
-                        Ref(svc_alb_sg)
-                    ],
-                    Name=alb_name,
-                    Tags=[
-                        {'Value': alb_name, 'Key': 'Name'},
-                        {"Key": "Team", "Value": self.team_name},
-                        {'Key': 'environment', 'Value': self.env}
-                    ]
-                )
+                    alb_name = f'{service_name[:32-len(self.env)]}{self.env_pascalcase}'
+            alb = ALBLoadBalancer(
+                f'ALB{service_name}',
+                Subnets=alb_subnets,
+                SecurityGroups=[
+                    self.alb_security_group,
+                    Ref(svc_alb_sg)
+                ],
+                Name=alb_name,
+                Tags=[
+                    {'Value': alb_name, 'Key': 'Name'},
+                    {"Key": "Team", "Value": self.team_name},
+                    {'Key': 'environment', 'Value': self.env}
+                ],
+                **alb_args
+            )
 
             self.template.add_resource(alb)
 
@@ -748,7 +661,7 @@ service is down',
                 service_name,
                 target_group_action,
                 alb,
-                config['http_interface']['internal']
+                is_alb_internal
             )
             default_disable_service_alarms = self.service_defaults.get('disable_service_alarms', False)
             is_alarms_disabled = config.get('disable_service_alarms', default_disable_service_alarms)
@@ -756,7 +669,6 @@ service is down',
             if not is_alarms_disabled:
                 self._add_alb_alarms(service_name, alb)
         else:
-            is_alb_internal = config.get('http_interface', {}).get('internal', True)
             cluster_alb_listener_rules = self._add_listener_rules_to_cluster_alb(config, service_name, service_target_group, is_alb_internal)
             service_listener = None
             alb = None
@@ -765,25 +677,27 @@ service is down',
         return alb, lb, service_listener, svc_alb_sg, cluster_alb_listener_rules
 
     def _fetch_cluster_alb_sg_id(self, is_alb_internal):
-        sg_outputs = list(
-            filter(
-                lambda x: re.match(r"SG(Internal|Public)\d+ID", x["OutputKey"]),
-                self.environment_stack["Outputs"],
-            )
-        )
+        sg_outputs = [
+            (output_key, output_value)
+            for output_key, output_value in self.environment_outputs.items()
+            if _CLUSTER_ALB_SG_OUTPUT_RE.match(output_key)
+        ]
         if not sg_outputs:
             raise UnrecoverableException("No security group found for cluster ALB")
 
-        for sg_output in sg_outputs:
-            if is_alb_internal and sg_output["OutputKey"].startswith("SGInternal"):
-                return sg_output["OutputValue"]
-            elif not is_alb_internal and sg_output["OutputKey"].startswith("SGPublic"):
-                return sg_output["OutputValue"]
+        for output_key, output_value in sg_outputs:
+            if is_alb_internal and output_key.startswith("SGInternal"):
+                return output_value
+            elif not is_alb_internal and output_key.startswith("SGPublic"):
+                return output_value
+
+        alb_type = "Internal" if is_alb_internal else "Internet facing"
+        raise UnrecoverableException(f"No {alb_type} security group found for cluster ALB")
 
     def _add_listener_rules_to_cluster_alb(self, config, service_name, target_group, is_alb_internal) -> list[ListenerRule]:
         # get the http_interface scheme
         hostnames = config.get('http_interface', {}).get('hostnames')
-        internal_listener_arns, public_listener_arns = self._fetch_cluster_alb_listeners_arns()
+        internal_listener_arns, public_listener_arns = self.cluster_alb_listeners_arns
 
         listener_arns = internal_listener_arns if is_alb_internal else public_listener_arns
 
@@ -797,7 +711,8 @@ service is down',
             return self._create_listener_rules(service_name, is_alb_internal, hostnames, internal_listener_arns, target_group_arn)
         return self._create_listener_rules(service_name, is_alb_internal, hostnames, public_listener_arns, target_group_arn)
 
-    def _fetch_cluster_alb_listeners_arns(self): 
+    @cached_property
+    def cluster_alb_listeners_arns(self):
         """
         Fetches the ARNs of the HTTP and HTTPS listeners on the cluster ALB from the environment
         stack outputs, categorized by internal and public ALB listeners.
@@ -811,14 +726,9 @@ service is down',
             'https': []
         }
 
-        for listener in list(
-            filter(
-                lambda x: re.match(r'ListenerHTTPS?(Internal|Public)\d+ARN', x['OutputKey']),
-                self.environment_stack['Outputs']
-            )
-        ):
-            output_key = listener['OutputKey']
-            output_value = listener['OutputValue']
+        for output_key, output_value in self.environment_outputs.items():
+            if not _CLUSTER_ALB_LISTENER_OUTPUT_RE.match(output_key):
+                continue
             protocol = "https" if "HTTPS" in output_key else "http"
             if output_key.find("Internal") != -1:
                 internal_alb_listener_arns[protocol].append(output_value)
@@ -869,31 +779,29 @@ service is down',
         MAX_PRIORITY = 49899
 
         # get all the listener rules in the listener
-        elbv2_client = get_client_for('elbv2', self.env)
-        rules = elbv2_client.describe_rules(ListenerArn=listener_arn, PageSize=400)
-
-        # check if there's already a rule with same host-header condition
-        for rule in rules['Rules']:
-            for condition in rule['Conditions']:
-                if condition['Field'] == 'host-header' and hostname in condition['HostHeaderConfig']['Values']:
-                    priority = int(rule['Priority'])
-                    # return the priority only if it's not a custom rule
-                    if priority > MIN_PRIORITY and priority < MAX_PRIORITY:
-                        return priority
-
-        existing_priorities: list[int] = []
-
-        for rule in rules['Rules']:
-            if rule['IsDefault']:
-                continue
-
-            priority = int(rule['Priority'])
-            existing_priorities.append(priority)
+        pages = self.elbv2_client.get_paginator('describe_rules').paginate(
+            ListenerArn=listener_arn,
+            PaginationConfig={'PageSize': 400}
+        )
+        existing_priorities: set[int] = set()
+        for page in pages:
+            for rule in page['Rules']:
+                if rule['IsDefault']:
+                    continue
+                priority = int(rule['Priority'])
+                # reuse the priority of a rule with the same host-header condition,
+                # but only if it's not a custom rule
+                if MIN_PRIORITY < priority < MAX_PRIORITY and any(
+                    condition['Field'] == 'host-header' and hostname in condition['HostHeaderConfig']['Values']
+                    for condition in rule['Conditions']
+                ):
+                    return priority
+                existing_priorities.add(priority)
 
         random_priority = self._generate_unique_priority(existing_priorities, MIN_PRIORITY, MAX_PRIORITY)
         return random_priority
 
-    def _generate_unique_priority(self, existing_priorities: list[int], min_priority=1, max_priority=49999) -> int:
+    def _generate_unique_priority(self, existing_priorities: set[int], min_priority=1, max_priority=49999) -> int:
         while True:
             priority = random.randint(min_priority, max_priority)
             if priority not in existing_priorities:
@@ -944,7 +852,7 @@ service is down',
                               alb, internal):
         ssl_cert = Certificate(CertificateArn=self.ssl_certificate_arn)
         service_listener = Listener(
-            "SslLoadBalancerListener" + service_name,
+            f"SslLoadBalancerListener{service_name}",
             Protocol="HTTPS",
             DefaultActions=[target_group_action],
             LoadBalancerArn=Ref(alb),
@@ -956,7 +864,7 @@ service is down',
         if internal:
             # Allow HTTP traffic on internal services
             http_service_listener = Listener(
-                "LoadBalancerListener" + service_name,
+                f"LoadBalancerListener{service_name}",
                 Protocol="HTTP",
                 DefaultActions=[target_group_action],
                 LoadBalancerArn=Ref(alb),
@@ -965,19 +873,10 @@ service is down',
             self.template.add_resource(http_service_listener)
         else:
             # Redirect HTTP to HTTPS on external services
-            redirection_config = RedirectConfig(
-                StatusCode='HTTP_301',
-                Protocol='HTTPS',
-                Port='443'
-            )
-            http_redirection_action = Action(
-                RedirectConfig=redirection_config,
-                Type="redirect"
-            )
             http_redirection_listener = Listener(
-                "LoadBalancerRedirectionListener" + service_name,
+                f"LoadBalancerRedirectionListener{service_name}",
                 Protocol="HTTP",
-                DefaultActions=[http_redirection_action],
+                DefaultActions=[_HTTP_TO_HTTPS_REDIRECT_ACTION],
                 LoadBalancerArn=Ref(alb),
                 Port=80
             )
@@ -985,105 +884,44 @@ service is down',
         return service_listener
 
     def _add_alb_alarms(self, service_name, alb):
-        unhealthy_alarm = Alarm(
-            'ElbUnhealthyHostAlarm' + service_name,
-            EvaluationPeriods=1,
-            Dimensions=[
-                MetricDimension(
-                    Name='LoadBalancer',
-                    Value=GetAtt(alb, 'LoadBalancerFullName')
-                )
-            ],
-            AlarmActions=[Ref(self.notification_sns_arn)],
-            OKActions=[Ref(self.notification_sns_arn)],
-            AlarmDescription='Triggers if any host is marked unhealthy',
-            Namespace='AWS/ApplicationELB',
-            Period=60,
-            ComparisonOperator='GreaterThanOrEqualToThreshold',
-            Statistic='Sum',
-            Threshold='1',
-            MetricName='UnHealthyHostCount',
-            TreatMissingData='notBreaching'
-        )
-        self.template.add_resource(unhealthy_alarm)
-        rejected_connections_alarm = Alarm(
-            'ElbRejectedConnectionsAlarm' + service_name,
-            EvaluationPeriods=1,
-            Dimensions=[
-                MetricDimension(
-                    Name='LoadBalancer',
-                    Value=GetAtt(alb, 'LoadBalancerFullName')
-                )
-            ],
-            AlarmActions=[Ref(self.notification_sns_arn)],
-            OKActions=[Ref(self.notification_sns_arn)],
-            AlarmDescription='Triggers if load balancer has \
-rejected connections because the load balancer \
-had reached its maximum number of connections.',
-            Namespace='AWS/ApplicationELB',
-            Period=60,
-            ComparisonOperator='GreaterThanOrEqualToThreshold',
-            Statistic='Sum',
-            Threshold='1',
-            MetricName='RejectedConnectionCount',
-            TreatMissingData='notBreaching'
-        )
-        self.template.add_resource(rejected_connections_alarm)
-        http_code_elb5xx_alarm = Alarm(
-            'ElbHTTPCodeELB5xxAlarm' + service_name,
-            EvaluationPeriods=1,
-            Dimensions=[
-                MetricDimension(
-                    Name='LoadBalancer',
-                    Value=GetAtt(alb, 'LoadBalancerFullName')
-                )
-            ],
-            AlarmActions=[Ref(self.notification_sns_arn)],
-            OKActions=[Ref(self.notification_sns_arn)],
-            AlarmDescription='Triggers if 5xx response originated \
-from load balancer',
-            Namespace='AWS/ApplicationELB',
-            Period=60,
-            ComparisonOperator='GreaterThanOrEqualToThreshold',
-            Statistic='Sum',
-            Threshold='3',
-            MetricName='HTTPCode_ELB_5XX_Count',
-            TreatMissingData='notBreaching'
-        )
-        self.template.add_resource(http_code_elb5xx_alarm)
+        alb_dimensions = [
+            MetricDimension(
+                Name='LoadBalancer',
+                Value=GetAtt(alb, 'LoadBalancerFullName')
+            )
+        ]
+        self.template.add_resource([
+            Alarm(
+                title + service_name,
+                Dimensions=alb_dimensions,
+                AlarmActions=self.notification_actions,
+                OKActions=self.notification_actions,
+                AlarmDescription=description,
+                Threshold=threshold,
+                MetricName=metric_name,
+                **self.ALB_ALARM_DEFAULTS
+            )
+            for title, metric_name, threshold, description in self.ALB_ALARMS
+        ])
 
     def _generate_alb_security_group_ingress(self, config):
-        ingress_rules = []
-        for access_ip in config['http_interface']['restrict_access_to']:
-            if access_ip.find('/') == -1:
-                access_ip = access_ip + '/32'
-            ingress_rules.append({
-                'ToPort': 80,
+        access_cidrs = [
+            access_ip if '/' in access_ip else access_ip + '/32'
+            for access_ip in config['http_interface']['restrict_access_to']
+        ]
+        return [
+            {
+                'ToPort': port,
                 'IpProtocol': 'TCP',
-                'FromPort': 80,
-                'CidrIp': access_ip
-            })
-            ingress_rules.append({
-                'ToPort': 443,
-                'IpProtocol': 'TCP',
-                'FromPort': 443,
-                'CidrIp': access_ip
-            })
-        return ingress_rules
+                'FromPort': port,
+                'CidrIp': access_cidr
+            }
+            for access_cidr in access_cidrs
+            for port in (80, 443)
+        ]
 
     def _add_ecs_service_iam_role(self):
         role_name = Sub('ecs-svc-${AWS::StackName}-${AWS::Region}')
-        assume_role_policy = {
-            u'Statement': [
-                {
-                    u'Action': [u'sts:AssumeRole'],
-                    u'Effect': u'Allow',
-                    u'Principal': {
-                        u'Service': [u'ecs.amazonaws.com']
-                    }
-                }
-            ]
-        }
         self.ecs_service_role = Role(
             'ECSServiceRole',
             Path='/',
@@ -1091,7 +929,7 @@ from load balancer',
                 'arn:aws:iam::aws:policy/service-role/AmazonEC2ContainerServiceRole'
             ],
             RoleName=role_name,
-            AssumeRolePolicyDocument=assume_role_policy
+            AssumeRolePolicyDocument=_ECS_ASSUME_ROLE_POLICY
         )
         self.template.add_resource(self.ecs_service_role)
 
@@ -1100,96 +938,87 @@ from load balancer',
             "CloudliftOptions",
             Description="Options used with cloudlift when \
 building this service",
-            Value=json.dumps(
-                self.configuration,
-                cls=DecimalEncoder
-            )
+            Value=json.dumps(self.configuration)
         ))
         self._add_stack_outputs()
 
     def _add_service_parameters(self):
+        self.environment_outputs = environment_outputs = {
+            output['OutputKey']: output['OutputValue']
+            for output in self.environment_stack['Outputs']
+        }
         self.notification_sns_arn = Parameter(
             "NotificationSnsArn",
             Description='',
             Type="String",
             Default=self.notifications_arn)
         self.template.add_parameter(self.notification_sns_arn)
+        self.notification_sns_arn_ref = Ref(self.notification_sns_arn)
+        self.notification_actions = [self.notification_sns_arn_ref]
         self.vpc = Parameter(
             "VPC",
             Description='',
             Type="AWS::EC2::VPC::Id",
-            Default=list(
-                filter(
-                    lambda x: x['OutputKey'] == "VPC",
-                    self.environment_stack['Outputs']
-                )
-            )[0]['OutputValue']
+            Default=environment_outputs["VPC"]
         )
         self.template.add_parameter(self.vpc)
-        self.public_subnet1 = Parameter(
-            "PublicSubnet1",
-            Description='',
-            Type="AWS::EC2::Subnet::Id",
-            Default=list(
-                filter(
-                    lambda x: x['OutputKey'] == "PublicSubnet1",
-                    self.environment_stack['Outputs']
-                )
-            )[0]['OutputValue']
-        )
-        self.template.add_parameter(self.public_subnet1)
-        self.public_subnet2 = Parameter(
-            "PublicSubnet2",
-            Description='',
-            Type="AWS::EC2::Subnet::Id",
-            Default=list(
-                filter(
-                    lambda x: x['OutputKey'] == "PublicSubnet2",
-                    self.environment_stack['Outputs']
-                )
-            )[0]['OutputValue']
-        )
-        self.template.add_parameter(self.public_subnet2)
-        self.private_subnet1 = Parameter(
-            "PrivateSubnet1",
-            Description='',
-            Type="AWS::EC2::Subnet::Id",
-            Default=list(
-                filter(
-                    lambda x: x['OutputKey'] == "PrivateSubnet1",
-                    self.environment_stack['Outputs']
-                )
-            )[0]['OutputValue']
-        )
-        self.template.add_parameter(self.private_subnet1)
-        self.private_subnet2 = Parameter(
-            "PrivateSubnet2",
-            Description='',
-            Type="AWS::EC2::Subnet::Id",
-            Default=list(
-                filter(
-                    lambda x: x['OutputKey'] == "PrivateSubnet2",
-                    self.environment_stack['Outputs']
-                )
-            )[0]['OutputValue']
-        )
-        self.template.add_parameter(self.private_subnet2)
         self.template.add_parameter(Parameter(
             "Environment",
             Description='',
             Type="String",
             Default="production"
         ))
-        self.alb_security_group = list(
-            filter(
-                lambda x: x['OutputKey'] == "SecurityGroupAlb",
-                self.environment_stack['Outputs']
-            )
-        )[0]['OutputValue']
+        self.alb_security_group = environment_outputs["SecurityGroupAlb"]
+
+    @cached_property
+    def private_subnet_refs(self):
+        return self._add_subnet_parameters('Private')
+
+    @cached_property
+    def public_subnet_refs(self):
+        return self._add_subnet_parameters('Public')
+
+    def _add_subnet_parameters(self, subnet_type):
+        # Subnet parameters are only registered once a resource refers to them
+        subnet_refs = []
+        for index in (1, 2):
+            parameter_name = f"{subnet_type}Subnet{index}"
+            subnet = self.template.add_parameter(Parameter(
+                parameter_name,
+                Description='',
+                Type="AWS::EC2::Subnet::Id",
+                Default=self.environment_outputs[parameter_name]
+            ))
+            subnet_refs.append(Ref(subnet))
+        return subnet_refs
+
+    @cached_property
+    def container_image(self):
+        return f"{self.ecr_image_uri}:{self.current_version}"
+
+    @cached_property
+    def execution_role_arn(self):
+        partition = region_service.get_partition_for_environment(self.env)
+        return f"arn:{partition}:iam::{self.account_id}:role/ecsTaskExecutionRole"
+
+    def _fetch_service_information(self):
+        # Resolved on this thread with the environment's client so the cached
+        # account id comes from the credentials in use after an MFA login
+        self.account_id = get_account_id(get_client_for('sts', self.env))
+        # The remaining lookups are independent AWS calls, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            current_version = executor.submit(self._fetch_current_version)
+            desired_counts = executor.submit(self._fetch_current_desired_count)
+        self.current_version = current_version.result()
+        self.desired_counts = desired_counts.result()
+
+    def _fetch_current_version(self):
+        return ServiceInformationFetcher(
+            self.application_name, self.env).get_current_version()
 
     def _fetch_current_desired_count(self):
         stack_name = get_service_stack_name(self.env, self.application_name)
-        self.desired_counts = {}
+        desired_counts = {}
         try:
             stack = region_service.get_client_for(
                 'cloudformation',
@@ -1199,33 +1028,26 @@ building this service",
                 lambda x: x['OutputKey'].endswith('EcsServiceName'),
                 stack['Outputs']
             )
-            ecs_service_names = []
-            for service_name in ecs_service_outputs:
-                ecs_service_names.append({
-                    "key": service_name['OutputKey'],
-                    "value": service_name['OutputValue']
-                })
-            ecs_client = EcsClient(None, None, self.region)
-            for service_name in ecs_service_names:
-                deployment = DeployAction(
-                    ecs_client,
-                    self.cluster_name,
-                    service_name["value"]
-                )
-                actual_service_name = service_name["key"]. \
-                    replace("EcsServiceName", "")
-                self.desired_counts[actual_service_name] = deployment. \
-                    service.desired_count
-            log("Existing service counts: " + str(self.desired_counts))
+            ecs_service_names = {
+                output['OutputValue']: output['OutputKey'].replace("EcsServiceName", "")
+                for output in ecs_service_outputs
+            }
+            ecs_client = region_service.get_client_for('ecs', self.env)
+            service_names = list(ecs_service_names)
+            # DescribeServices accepts at most 10 services per call
+            for i in range(0, len(service_names), _DESCRIBE_SERVICES_BATCH_SIZE):
+                services = ecs_client.describe_services(
+                    cluster=self.cluster_name,
+                    services=service_names[i:i + _DESCRIBE_SERVICES_BATCH_SIZE]
+                )['services']
+                for service in services:
+                    desired_counts[ecs_service_names[service['serviceName']]] = \
+                        service['desiredCount']
+            log("Existing service counts: " + str(desired_counts))
         except Exception:
             log_bold("Could not find existing services.")
+        return desired_counts
 
-    def _get_desired_task_count_for_service(self, service_name):
-        if service_name in self.desired_counts:
-            return self.desired_counts[service_name]
-        else:
-            return 0
-        
     def _firelens_container_def_args_override(self, configuration, container_def_args):
         logging_type = configuration.get("logging")
         firelens_dependency = ContainerDependency(
@@ -1248,54 +1070,55 @@ building this service",
         return container_def_args
 
     def _sidecar_container_defs(self, configuration, service_name):
+        sidecars = configuration.get('sidecars')
+        if not sidecars or not isinstance(sidecars, list):
+            return []
         container_definitions = []
-        if configuration.get('sidecars') and isinstance(configuration['sidecars'], list):
-            for index, sidecar in enumerate(configuration['sidecars']):
-                container_name = sidecar.get('name', f"sidecar_{index + 1}")
-                if not container_name.endswith('-sidecar'):
-                    container_name = container_name + '-sidecar'
-                image_uri = sidecar.get('image_uri')
-                memory_reservation = int(sidecar.get('memory_reservation', 50))
-                essential = sidecar.get('essential', True)
+        for index, sidecar in enumerate(sidecars):
+            container_name = sidecar.get('name', f"sidecar_{index + 1}")
+            if not container_name.endswith('-sidecar'):
+                container_name = container_name + '-sidecar'
+            image_uri = sidecar.get('image_uri')
+            memory_reservation = int(sidecar.get('memory_reservation', 50))
+            essential = sidecar.get('essential', True)
+            
+            
+            container_def_args = {}
+            command = sidecar.get('command')
+            if command is not None:
+                container_def_args['Command'] = [command]
                 
+            env = sidecar.get('env')
+            if env is not None and isinstance(env, dict):
+                container_def_args['Environment'] = []
+                for key, value in env.items():
+                    container_def_args['Environment'].append(Environment(Name=key, Value=value))
+            logging = sidecar.get('logging')
+            if logging is not None:
+                log_stream_prefix = service_name + f"-{container_name}"
+                container_def_args['LogConfiguration'] = self._gen_log_config(log_stream_prefix, logging)
+
+            health_check = sidecar.get('health_check')
+            if health_check is not None and health_check.get('command') is not None:
+                health_check_args = {}
+                health_check_args['Command'] = health_check['command']
                 
-                container_def_args = {}
-                command = sidecar.get('command')
-                if command is not None:
-                    container_def_args['Command'] = [command]
-                    
-                env = sidecar.get('env')
-                if env is not None and isinstance(env, dict):
-                    container_def_args['Environment'] = []
-                    for key, value in env.items():
-                        container_def_args['Environment'].append(Environment(Name=key, Value=value))
-                logging = sidecar.get('logging')
-                if logging is not None:
-                    log_stream_prefix = service_name + f"-{container_name}"
-                    log_type = "awslogs" if 'logging' not in sidecar else logging
-                    container_def_args['LogConfiguration'] = self._gen_log_config(log_stream_prefix, log_type)
-
-                health_check = sidecar.get('health_check')
-                if health_check is not None and health_check.get('command') is not None:
-                    health_check_args = {}
-                    health_check_args['Command'] = health_check['command']
-                    
-                    if health_check.get('interval') is not None:
-                        health_check_args['Interval'] = int(health_check['interval'])
-                    if health_check.get('retries') is not None:
-                        health_check_args['Retries'] = int(health_check['retries'])
-                    if health_check.get('timeout') is not None:
-                        health_check_args['Timeout'] = int(health_check['timeout'])
-
-                    container_def_args['HealthCheck'] = HealthCheck(**health_check_args)
-                container_definition = ContainerDefinition(
-                    Name=container_name,
-                    Image=image_uri,
-                    MemoryReservation=memory_reservation,
-                    Essential=essential,
-                    **self._sidecar_firelens_overrides(configuration, container_def_args)
-                )
-                container_definitions.append(container_definition)
+                if health_check.get('interval') is not None:
+                    health_check_args['Interval'] = int(health_check['interval'])
+                if health_check.get('retries') is not None:
+                    health_check_args['Retries'] = int(health_check['retries'])
+                if health_check.get('timeout') is not None:
+                    health_check_args['Timeout'] = int(health_check['timeout'])
+
+                container_def_args['HealthCheck'] = HealthCheck(**health_check_args)
+            container_definition = ContainerDefinition(
+                Name=container_name,
+                Image=image_uri,
+                MemoryReservation=memory_reservation,
+                Essential=essential,
+                **self._sidecar_firelens_overrides(configuration, container_def_args)
+            )
+            container_definitions.append(container_definition)
         return container_definitions
     
     def _sidecar_firelens_overrides(self, configuration, container_def_args):
@@ -1303,21 +1126,19 @@ building this service",
             container_def_args['FirelensConfiguration'] = FirelensConfiguration(Type='fluentbit')
         return container_def_args
 
-    @property
+    @cached_property
     def ecr_image_uri(self):
-        return str(self.account_id) + ".dkr.ecr." + \
-               self.region + ".amazonaws.com/" + \
-               self.repo_name
+        return f"{self.account_id}.dkr.ecr.{self.region}.amazonaws.com/{self.repo_name}"
 
-    @property
-    def account_id(self):
-        return get_account_id()
+    @cached_property
+    def elbv2_client(self):
+        return get_client_for('elbv2', self.env)
 
     @property
     def repo_name(self):
         return self.application_name + '-repo'
 
-    @property
+    @cached_property
     def notifications_arn(self):
         """
         Get the SNS arn either from service configuration or the cluster
@@ -38,7 +38,7 @@ class ServiceUpdater(object):
         self.build_args = build_args
 
     def run(self):
-        log_warning("Deploying to {self.region}".format(**locals()))
+        log_warning(f"Deploying to {self.region}")
         self.init_stack_info()
         if not os.path.exists(self.env_sample_file):
             raise UnrecoverableException('env.sample not found. Exiting.')
@@ -100,12 +100,8 @@ class ServiceUpdater(object):
                 StackName=self.stack_name
             )['Stacks'][0]
             self.ecs_service_names = [
-                service_name['OutputValue'] for service_name in list(
-                    filter(
-                        lambda x: x['OutputKey'].endswith('EcsServiceName'),
-                        stack['Outputs']
-                    )
-                )
+                service_name['OutputValue'] for service_name in stack['Outputs']
+                if service_name['OutputKey'].endswith('EcsServiceName')
             ]
         except ClientError as client_error:
             err = str(client_error)
@@ -34,7 +34,7 @@ class TaskDefinitionCreator:
         self.name_with_env = f"{pascalcase(self.name)}{pascalcase(self.environment)}"
 
     def create(self):
-        log_warning("Create task definition to {self.region}".format(**locals()))
+        log_warning(f"Create task definition to {self.region}")
         if not os.path.exists(self.env_sample_file):
             raise UnrecoverableException('env.sample not found. Exiting.')
         ecr_client = EcrClient(self.name, self.region, self.build_args)
@@ -65,7 +65,7 @@ class TaskDefinitionCreator:
         log_bold("Task definition successfully created\n")
 
     def update(self):
-        log_warning("Update task definition to {self.region}".format(**locals()))
+        log_warning(f"Update task definition to {self.region}")
         if not os.path.exists(self.env_sample_file):
             raise UnrecoverableException('env.sample not found. Exiting.')
         ecr_client = EcrClient(self.name, self.region, self.build_args)
@@ -1,8 +1,34 @@
+import yaml
+from cfn_flip.yaml_dumper import get_dumper, map_representer, string_representer
+from cfn_tools.odict import ODict
 from troposphere import Output, Ref, Template
 
 from cloudlift.config import region as region_service
 from cloudlift.config import get_cluster_name
 
+if getattr(yaml, '__with_libyaml__', False):
+    class _CfnCSafeDumper(yaml.CSafeDumper):
+        """libyaml emitter with cfn_flip's short-form intrinsic representers"""
+
+        def represent_scalar(self, tag, value, style=None):
+            if style is None and isinstance(value, str) and ('\n' in value or '\r' in value):
+                style = '"'
+            return super(_CfnCSafeDumper, self).represent_scalar(tag, value, style)
+
+    _CfnCSafeDumper.add_representer(ODict, map_representer)
+    _CfnCSafeDumper.add_representer(str, string_representer)
+else:
+    _CfnCSafeDumper = None
+
+
+def _to_odict(data):
+    """Sort keys into cfn_flip's ODict so intrinsics dump in short form"""
+    if isinstance(data, dict):
+        return ODict((key, _to_odict(data[key])) for key in sorted(data))
+    if isinstance(data, (list, tuple)):
+        return [_to_odict(item) for item in data]
+    return data
+
 
 class TemplateGenerator(object):
     """This is the base class for all templates"""
@@ -29,6 +55,18 @@ circle CI environment variables to validate during deployment.",
             )
         )
 
+    def _template_to_yaml(self):
+        data = _to_odict(self.template.to_dict())
+        # Both dumpers get the options explicitly: older cfn_flip releases do
+        # not pass them from dump_yaml, and libyaml would escape and wrap otherwise
+        return yaml.dump(
+            data,
+            Dumper=_CfnCSafeDumper or get_dumper(),
+            default_flow_style=False,
+            allow_unicode=True,
+            width=200
+        )
+
     @property
     def region(self):
         return region_service.get_region_for_environment(self.env)
@@ -1,11 +1,18 @@
 import datetime
+import threading
+from collections import defaultdict
 
-from cfn_flip import to_json
-from mock import patch
+import pytest
+from botocore.exceptions import ClientError
+from cfn_flip import load_yaml, to_json
+from mock import MagicMock, patch
 
+from cloudlift.config import EnvironmentConfiguration
 from cloudlift.config import ParameterStore
 from cloudlift.config import ServiceConfiguration
+from cloudlift.exceptions import UnrecoverableException
 from cloudlift.deployment.service_information_fetcher import ServiceInformationFetcher
+from cloudlift.deployment import template_generator
 from cloudlift.deployment.service_template_generator import ServiceTemplateGenerator
 from cloudlift.version import VERSION
 
@@ -31,6 +38,7 @@ def mocked_service_config(cls, *args, **kwargs):
         }
     }
 
+
 def mocked_fargate_service_config(cls, *args, **kwargs):
     return {
         "cloudlift_version": VERSION,
@@ -73,6 +81,66 @@ def mocked_service_information(cls, *args, **kwargs):
     return "master"
 
 
+ENVIRONMENT_OUTPUTS = [
+    {'OutputKey': 'VPC', 'OutputValue': 'vpc-00f07c5a6b6c9abdb'},
+    {'OutputKey': 'SecurityGroupAlb', 'OutputValue': 'sg-095dbeb511019cfd8'},
+    {'OutputKey': 'PrivateSubnet1', 'OutputValue': 'subnet-09b6cd23af94861cc'},
+    {'OutputKey': 'PrivateSubnet2', 'OutputValue': 'subnet-0657bc2faa99ce5f7'},
+    {'OutputKey': 'PublicSubnet1', 'OutputValue': 'subnet-0aeae8fe5e13a7ff7'},
+    {'OutputKey': 'PublicSubnet2', 'OutputValue': 'subnet-096377a44ccb73aca'},
+]
+
+
+def mocked_environment_configuration(cls, *args, **kwargs):
+    return {
+        "staging": {
+            "region": "ap-south-1",
+            "environment": {
+                "notifications_arn": "arn:aws:sns:ap-south-1:725827686899:non-prod-mumbai",
+                "ssl_certificate_arn": "arn:aws:acm:ap-south-1:725827686899:certificate/dummy"
+            }
+        }
+    }
+
+
+def mocked_parameter_store_config(cls, *args, **kwargs):
+    return {"VAR1": "val1"}, {"VAR1": "arn:aws:ssm:ap-south-1:725827686899:parameter/staging/dummy/VAR1"}
+
+
+@pytest.fixture
+def aws_clients():
+    """
+    Patches every AWS lookup made while generating a service template and
+    returns the mocked boto3 clients keyed by service name.
+    """
+    clients = defaultdict(MagicMock)
+
+    def mocked_client_for(resource, environment):
+        return clients[resource]
+
+    with patch.object(EnvironmentConfiguration, '__init__', return_value=None), \
+            patch.object(EnvironmentConfiguration, 'get_config', new=mocked_environment_configuration), \
+            patch.object(ParameterStore, '__init__', return_value=None), \
+            patch.object(ParameterStore, 'get_existing_config', new=mocked_parameter_store_config), \
+            patch.object(ServiceInformationFetcher, '__init__', return_value=None), \
+            patch.object(ServiceInformationFetcher, 'get_current_version', new=mocked_service_information), \
+            patch('cloudlift.config.region.get_client_for', new=mocked_client_for), \
+            patch('cloudlift.deployment.service_template_generator.get_client_for', new=mocked_client_for), \
+            patch('cloudlift.deployment.service_template_generator.get_account_id', return_value='725827686899'):
+        yield clients
+
+
+def build_template_generator(services, environment_outputs=ENVIRONMENT_OUTPUTS):
+    service_configuration = MagicMock(service_name='dummy', environment='staging')
+    service_configuration.get_config.return_value = {
+        "cloudlift_version": VERSION,
+        "services": services
+    }
+    template_generator = ServiceTemplateGenerator(service_configuration, {'Outputs': environment_outputs})
+    template_generator.env_sample_file_path = './test/templates/test_env.sample'
+    return template_generator
+
+
 class TestServiceTemplateGenerator(object):
     def test_initialization(self):
         with patch.object(ServiceConfiguration, 'get_config', new=mocked_service_config):
@@ -114,3 +182,267 @@ class TestServiceTemplateGenerator(object):
                     generated_template = template_generator.generate_service()
 
         assert to_json(''.join(open('./test/templates/expected_fargate_service_template.yml').readlines())) == to_json(generated_template)
+
+
+class TestServiceTemplateGeneratorClusterAlb(object):
+    cluster_alb_outputs = ENVIRONMENT_OUTPUTS + [
+        {'OutputKey': 'SGPublic1ID', 'OutputValue': 'sg-public'},
+        {'OutputKey': 'ListenerHTTPSPublic1ARN', 'OutputValue': 'arn:aws:elasticloadbalancing:listener/public-https'},
+    ]
+
+    def test_ec2_service_keeps_service_role_on_cluster_alb(self, aws_clients):
+        template_generator = build_template_generator({
+            "Dummy": {
+                "memory_reservation": 1000,
+                "command": None,
+                "http_interface": {
+                    "internal": False,
+                    "container_port": 7003,
+                    "restrict_access_to": ["0.0.0.0/0"],
+                    "alb_mode": "cluster",
+                    "hostnames": ["dummy.example.com"]
+                }
+            }
+        }, self.cluster_alb_outputs)
+        template_generator.generate_service()
+
+        service = template_generator.template.resources['Dummy']
+        assert service.Role.to_dict() == {'Ref': 'ECSServiceRole'}
+
+    def test_missing_cluster_alb_security_group_raises(self, aws_clients):
+        template_generator = build_template_generator({}, self.cluster_alb_outputs)
+        template_generator._add_service_parameters()
+
+        assert template_generator._fetch_cluster_alb_sg_id(False) == 'sg-public'
+        with pytest.raises(UnrecoverableException):
+            template_generator._fetch_cluster_alb_sg_id(True)
+
+
+class TestServiceTemplateGeneratorLookups(object):
+    def test_lookups_run_when_generating_service(self, aws_clients):
+        with patch.object(ServiceInformationFetcher, 'get_current_version', return_value='master') as get_current_version:
+            template_generator = build_template_generator({})
+            get_current_version.assert_not_called()
+            aws_clients['cloudformation'].describe_stacks.assert_not_called()
+
+            template_generator.generate_service()
+
+        get_current_version.assert_called_once_with()
+        aws_clients['cloudformation'].describe_stacks.assert_called_once_with(StackName='dummy-staging')
+        assert template_generator.current_version == 'master'
+        assert template_generator.account_id == '725827686899'
+
+    def test_account_id_is_resolved_on_calling_thread(self, aws_clients):
+        calling_threads = []
+
+        def mocked_get_account_id(sts_client):
+            calling_threads.append(threading.current_thread())
+            return '725827686899'
+
+        with patch('cloudlift.deployment.service_template_generator.get_account_id',
+                   side_effect=mocked_get_account_id) as get_account_id:
+            build_template_generator({}).generate_service()
+
+        get_account_id.assert_called_once_with(aws_clients['sts'])
+        assert calling_threads == [threading.current_thread()]
+
+    def test_execution_role_arn_uses_environment_partition(self, aws_clients):
+        template_generator = build_template_generator({})
+        template_generator.account_id = '725827686899'
+
+        with patch('cloudlift.config.region.get_region_for_environment', return_value='cn-north-1'):
+            execution_role_arn = template_generator.execution_role_arn
+
+        assert execution_role_arn == 'arn:aws-cn:iam::725827686899:role/ecsTaskExecutionRole'
+
+    def test_desired_counts_are_fetched_in_batches(self, aws_clients):
+        service_names = [f"Dummy{index}" for index in range(12)]
+        aws_clients['cloudformation'].describe_stacks.return_value = {'Stacks': [{'Outputs': [
+            {'OutputKey': f'{service_name}EcsServiceName', 'OutputValue': f'dummy-staging-{service_name}-a1b2'}
+            for service_name in service_names
+        ] + [{'OutputKey': 'StackName', 'OutputValue': 'dummy-staging'}]}]}
+        aws_clients['ecs'].describe_services.side_effect = lambda cluster, services: {
+            'services': [
+                {'serviceName': ecs_service_name, 'desiredCount': int(ecs_service_name.split('-')[2][5:])}
+                for ecs_service_name in services
+            ],
+            'failures': []
+        }
+
+        desired_counts = build_template_generator({})._fetch_current_desired_count()
+
+        requested_batches = [
+            call.kwargs['services'] for call in aws_clients['ecs'].describe_services.call_args_list
+        ]
+        assert [len(batch) for batch in requested_batches] == [10, 2]
+        assert all(call.kwargs['cluster'] == 'cluster-staging'
+                   for call in aws_clients['ecs'].describe_services.call_args_list)
+        assert desired_counts == {service_name: index for index, service_name in enumerate(service_names)}
+
+    def test_services_missing_from_ecs_keep_the_other_desired_counts(self, aws_clients):
+        aws_clients['cloudformation'].describe_stacks.return_value = {'Stacks': [{'Outputs': [
+            {'OutputKey': 'DummyEcsServiceName', 'OutputValue': 'dummy-staging-Dummy-a1b2'},
+            {'OutputKey': 'DummyWorkerEcsServiceName', 'OutputValue': 'dummy-staging-DummyWorker-c3d4'},
+        ]}]}
+        aws_clients['ecs'].describe_services.return_value = {
+            'services': [{'serviceName': 'dummy-staging-Dummy-a1b2', 'desiredCount': 3}],
+            'failures': [{'arn': 'dummy-staging-DummyWorker-c3d4', 'reason': 'MISSING'}]
+        }
+
+        desired_counts = build_template_generator({})._fetch_current_desired_count()
+
+        assert desired_counts == {'Dummy': 3}
+
+
+class TestServiceTemplateGeneratorSubnetParameters(object):
+    def test_public_only_service_declares_no_private_subnets(self, aws_clients):
+        template_generator = build_template_generator({
+            "Dummy": {
+                "memory_reservation": 1000,
+                "command": None,
+                "http_interface": {
+                    "internal": False,
+                    "container_port": 7003,
+                    "restrict_access_to": ["0.0.0.0/0"],
+                    "health_check_path": "/elb-check"
+                }
+            }
+        })
+        template_generator.generate_service()
+
+        parameters = template_generator.template.parameters
+        assert 'PublicSubnet1' in parameters and 'PublicSubnet2' in parameters
+        assert 'PrivateSubnet1' not in parameters and 'PrivateSubnet2' not in parameters
+
+    def test_awsvpc_service_declares_private_subnets(self, aws_clients):
+        template_generator = build_template_generator({
+            "DummyFargateWorker": {
+                "command": None,
+                "fargate": {"cpu": 256, "memory": 512},
+                "memory_reservation": 512
+            }
+        })
+        template_generator.generate_service()
+
+        parameters = template_generator.template.parameters
+        assert parameters['PrivateSubnet1'].Default == 'subnet-09b6cd23af94861cc'
+        assert parameters['PrivateSubnet2'].Default == 'subnet-0657bc2faa99ce5f7'
+        assert 'PublicSubnet1' not in parameters and 'PublicSubnet2' not in parameters
+        network_configuration = template_generator.template.resources['DummyFargateWorker'].NetworkConfiguration
+        assert [subnet.to_dict() for subnet in network_configuration.AwsvpcConfiguration.Subnets] == [
+            {'Ref': 'PrivateSubnet1'}, {'Ref': 'PrivateSubnet2'}
+        ]
+
+
+class TestServiceTemplateGeneratorListenerRulePriority(object):
+    listener_arn = 'arn:aws:elasticloadbalancing:listener/internal-https'
+    rule_pages = [
+        {'Rules': [
+            {'Priority': 'default', 'IsDefault': True, 'Conditions': []},
+            {'Priority': '150', 'IsDefault': False, 'Conditions': [
+                {'Field': 'host-header', 'HostHeaderConfig': {'Values': ['other.example.com']}}]},
+        ]},
+        {'Rules': [
+            {'Priority': '4000', 'IsDefault': False, 'Conditions': [
+                {'Field': 'host-header', 'HostHeaderConfig': {'Values': ['existing.example.com']}}]},
+        ]},
+    ]
+
+    def test_picks_a_priority_free_across_all_pages(self, aws_clients):
+        aws_clients['elbv2'].get_paginator.return_value.paginate.return_value = self.rule_pages
+        template_generator = build_template_generator({})
+
+        with patch('cloudlift.deployment.service_template_generator.random.randint',
+                   side_effect=[150, 4000, 4001]):
+            priority = template_generator._get_listener_rule_priority(self.listener_arn, 'dummy.example.com')
+
+        assert priority == 4001
+        aws_clients['elbv2'].get_paginator.assert_called_once_with('describe_rules')
+        aws_clients['elbv2'].get_paginator.return_value.paginate.assert_called_once_with(
+            ListenerArn=self.listener_arn,
+            PaginationConfig={'PageSize': 400}
+        )
+
+    def test_reuses_priority_of_rule_for_same_hostname_on_a_later_page(self, aws_clients):
+        aws_clients['elbv2'].get_paginator.return_value.paginate.return_value = self.rule_pages
+        template_generator = build_template_generator({})
+
+        priority = template_generator._get_listener_rule_priority(self.listener_arn, 'existing.example.com')
+
+        assert priority == 4000
+
+
+class TestServiceTemplateGeneratorYaml(object):
+    multi_line_value = 'première ligne – ü\nzweite Zeile ✓'
+    long_value = 'x' * 150
+
+    @pytest.mark.parametrize('use_libyaml', [True, False])
+    def test_non_ascii_and_long_values_render_alike_with_both_dumpers(self, aws_clients, use_libyaml):
+        dumper = template_generator._CfnCSafeDumper if use_libyaml else None
+        if use_libyaml and dumper is None:
+            pytest.skip('PyYAML is built without libyaml')
+        services = {
+            "Dummy": {
+                "memory_reservation": 1000,
+                "command": None,
+                "sidecars": [{
+                    "name": "proxy",
+                    "image_uri": "proxy:latest",
+                    "env": {"GREETING": self.multi_line_value, "TOKEN": self.long_value}
+                }]
+            }
+        }
+
+        with patch.object(template_generator, '_CfnCSafeDumper', dumper):
+            template_body, template_source, key = build_template_generator(services).generate_service()
+
+        assert template_source == 'TemplateBody'
+        assert 'ü' in template_body and '✓' in template_body
+        assert any(line.endswith(self.long_value) for line in template_body.splitlines())
+        sidecar = load_yaml(template_body)['Resources']['DummyTaskDefinition']['Properties']['ContainerDefinitions'][1]
+        assert {variable['Name']: variable['Value'] for variable in sidecar['Environment']} == {
+            'GREETING': self.multi_line_value,
+            'TOKEN': self.long_value
+        }
+
+
+def large_services_config():
+    return {
+        f"Dummy{index}": {
+            "memory_reservation": 1000,
+            "command": None,
+            "http_interface": {
+                "internal": False,
+                "container_port": 7003,
+                "restrict_access_to": ["0.0.0.0/0"],
+                "health_check_path": "/elb-check"
+            }
+        }
+        for index in range(25)
+    }
+
+
+class TestServiceTemplateGeneratorTemplateUpload(object):
+    def test_large_template_is_uploaded_to_s3(self, aws_clients):
+        template_url, template_source, key = build_template_generator(large_services_config()).generate_service()
+
+        assert template_source == 'TemplateURL'
+        assert template_url == f'https://cloudlift-service-template.s3.amazonaws.com/{key}'
+        put_object_kwargs = aws_clients['s3'].put_object.call_args.kwargs
+        assert put_object_kwargs['Bucket'] == 'cloudlift-service-template'
+        assert put_object_kwargs['Key'] == key
+        assert len(put_object_kwargs['Body']) > 51000
+
+    def test_access_denied_upload_raises_unrecoverable_exception(self, aws_clients):
+        aws_clients['s3'].put_object.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDenied', 'Message': 'Access Denied'}}, 'PutObject')
+
+        with pytest.raises(UnrecoverableException):
+            build_template_generator(large_services_config()).generate_service()
+
+    def test_other_upload_errors_are_reraised(self, aws_clients):
+        aws_clients['s3'].put_object.side_effect = ClientError(
+            {'Error': {'Code': 'NoSuchBucket', 'Message': 'No such bucket'}}, 'PutObject')
+
+        with pytest.raises(ClientError):
+            build_template_generator(large_services_config()).generate_service()